@@ -5,10 +5,127 @@ A minimal read-only app to compare your team's current week performance
 across all 9 categories against other teams in your league.
 """
 
+import asyncio
+import functools
+import hashlib
+import operator
 import os
+import pickle
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from time import time
+import numpy as np
 from yahoofantasy import Context
 from yahoofantasy import League, Team
+from yahoofantasy.api.attr import APIAttr
+
+# Pre-bound format callables for the report loops: each row would
+# otherwise re-parse the same format spec on every iteration
+_PCT_FMT = "{:.1f}%".format
+_NUM_FMT = "{:.2f}".format
+_ROW_FMT = "{:<40} {:<15} {:<20} {:<20} {:<20}".format
+_BEST_FMT = "{} ({})".format
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# numba.prange parallelizes the outer loop of the compiled kernel; plain
+# range keeps the pure-Python fallback working
+prange = numba.prange if numba is not None else range
+
+# Base URL for direct (non-library) requests to the Yahoo Fantasy API
+YAHOO_API_BASE = "https://fantasysports.yahooapis.com/fantasy/v2"
+
+# Sub-resources batched onto every scoreboard request via ';out='. Both
+# fetch_bundle and the async prefetch persist under the same bundle key,
+# so they must request the same shape
+BUNDLE_SUBRESOURCES = "teams"
+
+# Season the league lookup defaults to
+DEFAULT_SEASON = 2025
+
+# Disk cache so repeat runs skip Yahoo entirely for unchanged data
+CACHE_DIR = os.path.expanduser("~/.cache/yahoofantasy-compare")
+
+# In-process layer on top of the disk cache for same-run repeated calls
+_CACHE_MEMO = {}
+
+# The library's persistence layer does unlocked read-modify-write saves of
+# the single .yahoofantasy pickle (which also holds the OAuth tokens), so
+# every call that can write it - background team warms, bundle fetches,
+# prefetch saves, Week.sync - must be serialized behind this lock or
+# interleaved saves can lose entries or tear the file
+_PERSIST_LOCK = threading.Lock()
+
+
+def _cache_path(key):
+    """Build a cache file path for a cache key tuple like ('teams', league_id)."""
+    digest = hashlib.md5(repr(key).encode()).hexdigest()
+    return os.path.join(CACHE_DIR, f"{key[0]}_{digest}.pkl")
+
+
+def _cache_load(key, ttl):
+    """
+    Load a value from the cache, or None on a miss.
+    ttl is the max age in seconds; None means the entry never expires.
+    """
+    if key in _CACHE_MEMO:
+        return _CACHE_MEMO[key]
+    try:
+        path = _cache_path(key)
+        if not os.path.isfile(path):
+            return None
+        if ttl is not None and time() - os.path.getmtime(path) > ttl:
+            return None
+        with open(path, 'rb') as fp:
+            value = pickle.load(fp)
+        _CACHE_MEMO[key] = value
+        return value
+    except Exception:
+        # A broken cache entry should never break the run
+        return None
+
+
+def _cache_save(key, value):
+    """Save a value to the cache (best effort - failures are ignored)."""
+    _CACHE_MEMO[key] = value
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(_cache_path(key), 'wb') as fp:
+            pickle.dump(value, fp)
+    except Exception:
+        pass
+
+
+def get_cached_leagues(ctx: Context, sport, year):
+    """Get leagues for a sport/year, cached across invocations."""
+    key = ("leagues", sport, year)
+    leagues = _cache_load(key, ttl=3600)
+    if leagues is None:
+        with _PERSIST_LOCK:
+            leagues = ctx.get_leagues(sport, year)
+        _cache_save(key, leagues)
+    return leagues
+
+
+def get_league_teams(league: League):
+    """Get the league's teams, cached across invocations and within a run."""
+    key = ("teams", league.id)
+    teams = _cache_load(key, ttl=3600)
+    if teams is None:
+        with _PERSIST_LOCK:
+            teams = league.teams()
+        _cache_save(key, teams)
+    return teams
 
 # ANSI color codes for terminal output
 class Colors:
@@ -74,31 +191,52 @@ def select_sport():
         print("Please enter 1, 2, 3, or 4")
 
 
-def select_league(ctx: Context, sport='nba'):
-    """Allow user to select a league from their available leagues."""
+def select_league(ctx: Context, sport='nba', pool=None, leagues_future=None):
+    """
+    Allow user to select a league from their available leagues.
+
+    leagues_future optionally carries a speculative background fetch of this
+    sport's leagues that was started while the user answered the previous
+    prompt; pool is used to warm each listed league's teams while the user
+    decides here.
+    """
     print("\nFetching your leagues...")
-    
+
     try:
         # Get current year
-        current_year = 2025
+        current_year = DEFAULT_SEASON
         print(f"Defaulting to {current_year}")
-        
+
+        # Use the speculative background fetch if it matches and worked
+        leagues = None
+        if leagues_future is not None:
+            try:
+                leagues = leagues_future.result()
+            except Exception:
+                leagues = None
+
         # Try to get leagues for current year, fallback to previous year if needed
-        leagues = []
-        try:
-            leagues = ctx.get_leagues(sport, current_year)
-        except:
-            # throw error
-            raise Exception("No leagues found for " + sport + " in " + current_year)
-        
+        if leagues is None:
+            try:
+                leagues = get_cached_leagues(ctx, sport, current_year)
+            except:
+                # throw error
+                raise Exception("No leagues found for " + sport + " in " + current_year)
+
         if not leagues:
             print(f"No leagues found for {sport}.")
             sys.exit(1)
-        
+
         print(f"\nFound {len(leagues)} league(s):")
         for i, league in enumerate(leagues, 1):
             print(f"  {i}. {league.name} (ID: {league.league_id})")
-        
+
+        # Warm each league's teams in the background while the user decides;
+        # if they pick a different league the wasted fetch is negligible
+        if pool is not None:
+            for league in leagues:
+                pool.submit(get_league_teams, league)
+
         while True:
             try:
                 choice = input(f"\nSelect a league (1-{len(leagues)}): ").strip()
@@ -120,6 +258,58 @@ def select_league(ctx: Context, sport='nba'):
         sys.exit(1)
 
 
+def _teams_from_bundle(league: League, week_data):
+    """Build the league's Team objects from a bundle's ';out=teams' block."""
+    from yahoofantasy.api.parse import as_list, from_response_object, get_value
+    from yahoofantasy.resources.team import Team
+
+    teams = []
+    for team in as_list(week_data["fantasy_content"]["league"]["teams"]["team"]):
+        t = Team(league.ctx, league, get_value(team["team_key"]))
+        from_response_object(t, team)
+        teams.append(t)
+    return teams
+
+
+def fetch_bundle(league: League, week: int):
+    """
+    Fetch the scoreboard and team roster for a week in one batched request.
+
+    Yahoo's API supports combined sub-resources via ';out=', so the league
+    info, matchups (with per-team stats), and team roster that used to take
+    separate calls all come back in a single response. The roster block is
+    parsed here and seeded into the teams cache, so get_league_teams never
+    needs its own round trip once any week's bundle has been fetched.
+
+    The parsed response dict goes through the layered cache: in-process for
+    repeated accessors within a run, and pickled on disk so warm runs skip
+    both the network and the XML parse (the library persists raw XML and
+    re-parses it on every load; unpickling the dict is several times
+    cheaper than rebuilding it from the 50-200KB payload).
+    """
+    cache_key = ("bundle", league.id, week)
+    bundle = _cache_load(cache_key, ttl=300)
+    if bundle is not None:
+        return bundle
+
+    with _PERSIST_LOCK:
+        bundle = league.ctx._load_or_fetch(
+            f"bundle.{league.id}.{week}",
+            f"scoreboard;week={week};out={BUNDLE_SUBRESOURCES}",
+            league=league.id,
+        )
+    _cache_save(cache_key, bundle)
+
+    # Serve future get_league_teams calls straight from this response; a
+    # malformed teams block just means the separate fetch path still runs
+    try:
+        _cache_save(("teams", league.id), _teams_from_bundle(league, bundle))
+    except Exception:
+        pass
+
+    return bundle
+
+
 def sync_league_data(league: League, week: int):
     """
     Sync league data from scoreboard to ensure game_code and other attributes are set.
@@ -127,18 +317,12 @@ def sync_league_data(league: League, week: int):
     """
     try:
         from yahoofantasy.api.parse import from_response_object
-        
-        # Fetch scoreboard data which includes league info
-        week_data = league.ctx._load_or_fetch(
-            f"weeks.{league.id}.{week}",
-            f"scoreboard;week={week}",
-            league=league.id,
-        )
-        
-        # Extract and sync league info from scoreboard response
+
+        # Extract and sync league info from the batched scoreboard response
+        week_data = fetch_bundle(league, week)
         league_info = week_data["fantasy_content"]["league"]
         from_response_object(league, league_info)
-        
+
         return True
     except Exception as e:
         print(f"Warning: Could not sync league data: {e}")
@@ -157,29 +341,79 @@ def get_current_week(league: League):
     except:
         # Fallback: try to determine from scoreboard
         try:
-            # Fetch scoreboard for week 1 to get league info
-            week_data = league.ctx._load_or_fetch(
-                f"weeks.{league.id}.1",
-                f"scoreboard;week=1",
-                league=league.id,
-            )
+            # Fetch the week 1 bundle to get league info
+            week_data = fetch_bundle(league, 1)
             league_info = week_data["fantasy_content"]["league"]
             if "current_week" in league_info:
                 from yahoofantasy.api.parse import get_value
                 return get_value(league_info["current_week"])
         except:
             pass
-    
+
     # Default fallback
     return 1
 
 
+# Parsed Matchup lists per (league id, week): main() prints the week's
+# matchups and get_all_team_stats_from_matchups walks them again, and
+# without this memo each call would rebuild every Matchup object from the
+# bundle (or worst case re-sync the Week against the API)
+_MATCHUPS_MEMO = {}
+
+
+def get_week_matchups(league: League, week: int):
+    """
+    Get the list of Matchup objects for a week, parsed from the batched bundle.
+
+    Parses at most once per (league, week) per process; repeat calls get
+    the memoized list. Falls back to the library's Week.sync() (with
+    concurrent prefetch) if the bundle response doesn't contain the
+    expected scoreboard shape.
+    """
+    from yahoofantasy.resources.week import Week
+
+    memo_key = (league.id, week)
+    cached = _MATCHUPS_MEMO.get(memo_key)
+    if cached is not None:
+        return cached
+
+    try:
+        from yahoofantasy.api.parse import as_list, from_response_object
+        from yahoofantasy.resources.matchup import Matchup
+
+        week_data = fetch_bundle(league, week)
+        matchup_data = week_data["fantasy_content"]["league"]["scoreboard"]["matchups"]
+
+        week_obj = Week(league.ctx, league, week)
+        if "matchup" in matchup_data:
+            for matchup in as_list(matchup_data["matchup"]):
+                matchup_obj = Matchup(league.ctx, league, week_obj)
+                week_obj.matchups.append(from_response_object(matchup_obj, matchup))
+        _MATCHUPS_MEMO[memo_key] = week_obj.matchups
+        return week_obj.matchups
+    except Exception as e:
+        print(f"Warning: Could not parse matchups from bundle: {e}")
+
+    # Fallback: sync the Week the traditional way
+    if httpx is not None:
+        try:
+            asyncio.run(_fetch_all(league, week))
+        except Exception as e:
+            print(f"Warning: Concurrent prefetch failed, falling back to serial fetch: {e}")
+
+    week_obj = Week(league.ctx, league, week)
+    with _PERSIST_LOCK:
+        week_obj.sync()
+    _MATCHUPS_MEMO[memo_key] = week_obj.matchups
+    return week_obj.matchups
+
+
 def select_team(league: League):
     """Allow user to select a team from the league."""
     print("\nFetching teams in the league...")
-    
+
     try:
-        teams = league.teams()
+        teams = get_league_teams(league)
         
         if not teams:
             print("No teams found in this league.")
@@ -210,20 +444,126 @@ def select_team(league: League):
         sys.exit(1)
 
 
-def get_all_team_stats_from_matchups(league: League, week: int):
+def _ensure_access_token(ctx: Context):
+    """Make sure the context has a fresh access token for direct requests."""
+    if not ctx._access_token or time() > ctx._access_token_expires:
+        # Token refresh rewrites the persistence file too
+        with _PERSIST_LOCK:
+            ctx._get_access_token()
+    return ctx._access_token
+
+
+async def _prefetch_raw(ctx: Context, targets):
+    """
+    Fetch a list of (persist_key, url) targets concurrently over a single
+    HTTP/2 connection and save the raw responses into the library's
+    persistence, so the existing sync parsing paths become cache hits.
+    Already-persisted keys are skipped.
+
+    One httpx.AsyncClient serves the whole batch: with http2 enabled every
+    request multiplexes over one TLS connection, so N concurrent requests
+    pay for one handshake instead of N.
+    """
+    from yahoofantasy.api.parse import parse_response
+
+    # Only fetch payloads that aren't already persisted
+    with _PERSIST_LOCK:
+        targets = [
+            (key, url) for key, url in targets
+            if ctx._load(key, default=None) is None
+        ]
+    if not targets:
+        return
+
+    token = _ensure_access_token(ctx)
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "User-Agent": "Mozilla/5.0",
+    }
+
+    async with httpx.AsyncClient(http2=True, headers=headers, timeout=10.0) as client:
+        responses = await asyncio.gather(*[client.get(url) for _, url in targets])
+
+    for (key, _), response in zip(targets, responses):
+        response.raise_for_status()
+        # Parse before persisting so we never save error data
+        body = response.text
+        parse_response(body)
+        with _PERSIST_LOCK:
+            ctx._save(key, body)
+
+
+async def _fetch_all(league: League, week: int):
+    """
+    Prefetch the scoreboard and teams payloads for a week concurrently.
+
+    Week.sync() and league.teams() each block on their own round trip to
+    Yahoo; fetching both payloads at once collapses that to ~1 RTT.
+    """
+    await _prefetch_raw(league.ctx, [
+        (
+            f"weeks.{league.id}.{week}",
+            f"{YAHOO_API_BASE}/league/{league.id}/scoreboard;week={week}",
+        ),
+        (
+            f"teams.{league.id}",
+            f"{YAHOO_API_BASE}/league/{league.id}/teams",
+        ),
+    ])
+
+
+async def fetch_weeks(league: League, weeks):
+    """
+    Prefetch the scoreboard bundles for several weeks concurrently.
+
+    Completed weeks never change, so fetching the last K weeks in one
+    asyncio.gather costs roughly a single round trip and lets multi-week
+    comparisons run without any extra latency.
+    """
+    await _prefetch_raw(league.ctx, [
+        (
+            f"bundle.{league.id}.{week}",
+            f"{YAHOO_API_BASE}/league/{league.id}/scoreboard;week={week};out={BUNDLE_SUBRESOURCES}",
+        )
+        for week in weeks
+    ])
+
+
+def prefetch_weeks(league: League, weeks):
+    """Sync driver for fetch_weeks. Best effort - failures fall back to serial."""
+    if httpx is None or not weeks:
+        return
+    try:
+        asyncio.run(fetch_weeks(league, weeks))
+    except Exception as e:
+        print(f"Warning: Concurrent week prefetch failed, falling back to serial fetch: {e}")
+
+
+def get_all_team_stats_from_matchups(league: League, week: int, current_week: int = None):
     """
     Get stats for all teams from matchups for a specific week.
     Returns a dictionary mapping team_id to a list of Stat objects.
+
+    Completed weeks (week < current_week) never change, so they're cached
+    permanently; the current week keeps a short TTL so in-progress stats
+    stay reasonably fresh.
     """
+    if current_week is not None and week < current_week:
+        ttl = None
+    else:
+        ttl = 300
+
+    cache_key = ("team_stats", league.id, week)
+    cached = _cache_load(cache_key, ttl)
+    if cached is not None:
+        return cached
+
     team_stats_dict = {}
-    
+
     try:
-        # Use Week object to get matchups (this is the proper way)
-        from yahoofantasy.resources.week import Week
-        week_obj = Week(league.ctx, league, week)
-        week_obj.sync()
-        
-        for matchup in week_obj.matchups:
+        matchups = get_week_matchups(league, week)
+
+        for matchup in matchups:
             try:
                 # Get stats from team1
                 if hasattr(matchup, 'team1_stats'):
@@ -245,7 +585,11 @@ def get_all_team_stats_from_matchups(league: League, week: int):
                             team_stats_dict[team2.team_id] = team2_stats
             except Exception as e:
                 print(f"Warning: Could not get team2_stats: {e}")
-        
+
+        # Only cache successful fetches so a bad week can be retried
+        if team_stats_dict:
+            _cache_save(cache_key, team_stats_dict)
+
         return team_stats_dict
     except Exception as e:
         print(f"Warning: Could not fetch stats from matchups for week {week}: {e}")
@@ -290,10 +634,12 @@ def get_category_info_from_stats(stats_list):
     return categories_info
 
 
+@functools.lru_cache(maxsize=None)
 def is_percentage_stat(stat_id_or_index, stat_display=None):
     """
     Check if a stat is a percentage stat based on stat ID or display name.
     Percentage stats in NBA: FG% (5), FT% (8), 3PT% (11)
+    Pure function called from the inner comparison loops, so results are cached.
     """
     percentage_stat_ids = {'5', '8', '11'}  # FG%, FT%, 3PT%
     
@@ -306,120 +652,258 @@ def is_percentage_stat(stat_id_or_index, stat_display=None):
     return False
 
 
-def convert_percentage_value(raw_value):
+# Multiplicative scale per percentage stat_id, calibrated once per run.
+# Yahoo's format is consistent within a session, so after calibration the
+# conversion is a single multiply instead of a branch ladder per call.
+_PERCENTAGE_SCALES = {}
+
+
+def _scale_for_value(val):
     """
-    Convert Yahoo's percentage format to a percentage decimal.
-    
+    Pick the multiplicative scale that converts a raw percentage value to a
+    decimal (0.454 for 45.4%).
+
     The yahoofantasy library may already convert percentages to decimals.
     If the value is already < 1, it's likely already a decimal (0.454 = 45.4%).
     If the value is >= 1, it needs conversion:
+    - 45.4 = 45.4% (divide by 100 to get 0.454)
     - 454 = 45.4% (divide by 10 to get 45.4, then divide by 100 to get 0.454)
     - 4540 = 45.4% (divide by 100 to get 45.4, then divide by 100 to get 0.454)
-    
+    """
+    if val < 1.0:
+        return 1.0
+    if val >= 1000:
+        return 0.0001
+    if val >= 100:
+        return 0.001
+    return 0.01
+
+
+def _calibrate_percentage_scales(sample_stats):
+    """
+    Detect the percentage scale once per stat_id from a sample stats list.
+    Subsequent convert_percentage_value calls become a dict get + multiply.
+    """
+    for stat in (sample_stats or []):
+        if not hasattr(stat, 'id') or not hasattr(stat, 'value'):
+            continue
+        stat_id = str(stat.id)
+        if not is_percentage_stat(stat_id, getattr(stat, 'display', None)):
+            continue
+        try:
+            val = float(stat.value)
+        except (ValueError, TypeError):
+            continue
+        # Exactly 1.0 is ambiguous - a perfect decimal (100%) or a raw 1% -
+        # so don't lock a possibly wrong scale in for the whole run; cells
+        # with no calibrated scale fall back to per-value detection
+        if val == 1.0:
+            continue
+        _PERCENTAGE_SCALES[stat_id] = _scale_for_value(val)
+
+
+def convert_percentage_value(raw_value, stat_id=None):
+    """
+    Convert Yahoo's percentage format to a percentage decimal.
+    Uses the per-stat scale calibrated by _calibrate_percentage_scales when
+    available, falling back to per-value detection otherwise.
+
     Returns the percentage as a decimal (0.454 for 45.4%)
     """
     try:
+        scale = _PERCENTAGE_SCALES.get(stat_id)
+        if scale is not None:
+            return float(raw_value) * scale
+
+        # Not calibrated for this stat: detect the scale from this value
         val = float(raw_value)
-        
-        # If value is already < 1, it's likely already converted to decimal format
-        # The yahoofantasy library may have already done the conversion
-        if val < 1.0:
-            return val
-        
-        # If value is >= 1000, likely format is 4540 = 45.4%
-        # Divide by 100 to get 45.4, then by 100 to get 0.454
-        if val >= 1000:
-            return (val / 100.0) / 100.0
-        
-        # If value is >= 100, likely format is 454 = 45.4%
-        # Divide by 10 to get 45.4, then by 100 to get 0.454
-        elif val >= 100:
-            return (val / 10.0) / 100.0
-        
-        # If value is between 1 and 100, likely format is 45.4 = 45.4%
-        # But this is ambiguous - could be 45.4% or 0.454%
-        # Assume it's already a percentage value, divide by 100
-        elif val >= 1:
-            return val / 100.0
-        
-        # Shouldn't reach here if val < 1, but just in case
-        return val
+        return val * _scale_for_value(val)
     except (ValueError, TypeError):
         return None
 
 
-def extract_stat_value(stats_list, stat_id_or_index, stat_display=None):
+def _convert_raw_value(val, is_percentage, stat_id=None):
     """
-    Extract a stat value from a list of Stat objects.
-    stats_list: List of Stat objects from matchup.team1_stats or matchup.team2_stats
-    stat_id_or_index: Either a stat_id (string) or index (int) to find the stat
-    stat_display: Optional display name of the stat (for percentage detection)
+    Convert a raw Stat value to a float, or None if it's missing/empty.
+    Handles empty APIAttr placeholders, "/" and "" sentinel values, and
+    percentage conversion.
     """
-    if not stats_list:
+    if isinstance(val, APIAttr) and not val.__dict__:
         return None
-    
+    if val == "/" or val == "":
+        return None
+
+    # Convert percentage values
+    if is_percentage:
+        return convert_percentage_value(val, stat_id)
+
     try:
-        # Handle empty values (APIAttr objects that are empty dicts)
-        from yahoofantasy.api.attr import APIAttr
-        
-        # Determine if this is a percentage stat
-        is_percentage = is_percentage_stat(stat_id_or_index, stat_display)
-        
-        # Always try to find by stat.id first (most reliable)
-        # Only use index as a last resort fallback
-        for stat in stats_list:
-            if hasattr(stat, 'id') and str(stat.id) == str(stat_id_or_index):
-                if hasattr(stat, 'value'):
-                    val = stat.value
-                    if isinstance(val, APIAttr) and not val.__dict__:
-                        return None
-                    if val == "/" or val == "":
-                        return None
-                    
-                    # Convert percentage values
-                    if is_percentage:
-                        converted = convert_percentage_value(val)
-                        return converted if converted is not None else None
-                    
-                    try:
-                        return float(val)
-                    except (ValueError, TypeError):
-                        return val if val else None
-        
-        # Fallback: use index if stat_id_or_index is numeric
-        try:
-            idx = int(stat_id_or_index)
-            if 0 <= idx < len(stats_list):
-                stat = stats_list[idx]
-                if hasattr(stat, 'value'):
-                    val = stat.value
-                    if isinstance(val, APIAttr) and not val.__dict__:
-                        return None
-                    if val == "/" or val == "":
-                        return None
-                    
-                    # Check if this stat is a percentage by display name
-                    if hasattr(stat, 'display') and '%' in stat.display:
-                        converted = convert_percentage_value(val)
-                        return converted if converted is not None else None
-                    
-                    try:
-                        return float(val)
-                    except (ValueError, TypeError):
-                        return val if val else None
-        except (ValueError, TypeError):
-            pass
-        
-    except Exception as e:
-        pass
-    
-    return None
+        return float(val)
+    except (ValueError, TypeError):
+        return val if val else None
+
+
+def precompute_team_values(all_team_stats, categories_info):
+    """
+    Build a {team_id: {stat_id: value}} lookup from the raw stats lists.
+
+    The comparison views need one value per team per category; looking
+    each one up with a linear scan of the stats list would cost
+    O(teams x categories x stats). Walking each stats list once up front
+    and converting every category value turns all of those lookups into
+    O(1) dict gets.
+    """
+    team_values = {}
+
+    # Resolve each category's id/index/percentage flag once, outside the
+    # per-team loop
+    cat_flags = [
+        (cat_info['id'], cat_info.get('index'),
+         is_percentage_stat(cat_info['id'], cat_info['name']))
+        for cat_info in categories_info
+    ]
+
+    # Local binding for the per-cell conversion call
+    convert = _convert_raw_value
+
+    for team_id, stats_list in all_team_stats.items():
+        stats_by_id = {}
+        for stat in (stats_list or []):
+            if hasattr(stat, 'id'):
+                stats_by_id[str(stat.id)] = stat
+
+        values = {}
+        for stat_id, idx, is_percentage in cat_flags:
+            stat = stats_by_id.get(stat_id)
+
+            if stat is None:
+                # Fall back to positional lookup when the id isn't present
+                if idx is not None and stats_list and 0 <= idx < len(stats_list):
+                    stat = stats_list[idx]
+
+            if stat is None or not hasattr(stat, 'value'):
+                values[stat_id] = None
+                continue
+
+            values[stat_id] = convert(stat.value, is_percentage, stat_id)
+
+        team_values[team_id] = values
+
+    return team_values
+
+
+def _reduce(values, direction, sel_idx):
+    """
+    Per-category reductions over the (categories x teams) value matrix.
+
+    Returns (vs_counts, best_idx, worst_idx, valid_counts) where vs_counts
+    is how many teams the selected column beats per category, best/worst
+    are column indexes (-1 when no team has a value), and valid_counts is
+    the number of non-NaN entries per category.
+
+    Written as explicit loops over contiguous arrays so Numba can compile
+    it to native, parallel code when installed - that's what keeps a
+    multi-week history mode (weeks x categories x teams) cheap. Without
+    Numba the loop cost is negligible at single-league sizes.
+    """
+    num_cats, num_teams = values.shape
+    vs_counts = np.zeros(num_cats, dtype=np.int64)
+    best_idx = np.full(num_cats, -1, dtype=np.int64)
+    worst_idx = np.full(num_cats, -1, dtype=np.int64)
+    valid_counts = np.zeros(num_cats, dtype=np.int64)
+
+    for c in prange(num_cats):
+        sel = values[c, sel_idx] * direction[c]
+        sel_valid = not np.isnan(sel)
+        best = -np.inf
+        worst = np.inf
+        for t in range(num_teams):
+            v = values[c, t]
+            if np.isnan(v):
+                continue
+            dv = v * direction[c]
+            valid_counts[c] += 1
+            if dv > best:
+                best = dv
+                best_idx[c] = t
+            if dv < worst:
+                worst = dv
+                worst_idx[c] = t
+            if sel_valid and sel > dv:
+                vs_counts[c] += 1
+
+    return vs_counts, best_idx, worst_idx, valid_counts
+
+
+if numba is not None:
+    # cache=True persists the compiled kernel across runs so only the very
+    # first invocation pays the JIT cost
+    _reduce = numba.njit(cache=True, parallel=True)(_reduce)
+
+
+@dataclass(slots=True)
+class LeagueReport:
+    """
+    One week's league snapshot: the (categories x teams) value matrix plus
+    the row/column labels and per-category masks needed to render it.
+
+    Everything both report views consume travels in this one object, so
+    adding a derived field later means touching the builder, not every
+    call site. values is float32 - fantasy stat precision never needs
+    more, and halving the matrix keeps a full-season stack of these
+    comfortably cache-resident. slots=True drops the per-instance dict.
+    """
+    values: np.ndarray
+    team_ids: tuple
+    category_ids: tuple
+    lower_mask: np.ndarray
+    pct_mask: np.ndarray
+
+
+def build_report_matrix(team_values, categories_info, team_ids):
+    """
+    Stack the precomputed team values into a LeagueReport.
+
+    The value matrix holds NaN for missing entries; both the league-wide
+    comparison and the head-to-head report are reductions over this one
+    array, so the underlying stats lists are traversed only once per run,
+    and the string-based stat classification runs once per category
+    instead of once per cell.
+    """
+    def _as_float(value):
+        return value if isinstance(value, float) else np.nan
+
+    values = np.array(
+        [[_as_float(team_values[tid].get(cat_info['id'])) for tid in team_ids]
+         for cat_info in categories_info],
+        dtype=np.float32,
+    )
+
+    lower_mask = np.array(
+        [is_lower_better_stat(cat_info['name'], cat_info['id'])
+         for cat_info in categories_info]
+    )
+
+    pct_mask = np.array(
+        [is_percentage_stat(cat_info['id'], cat_info['name'])
+         for cat_info in categories_info]
+    )
+
+    return LeagueReport(
+        values=values,
+        team_ids=tuple(team_ids),
+        category_ids=tuple(cat_info['id'] for cat_info in categories_info),
+        lower_mask=lower_mask,
+        pct_mask=pct_mask,
+    )
 
 
+@functools.lru_cache(maxsize=None)
 def is_lower_better_stat(category_name, stat_id=None):
     """
     Determine if lower values are better for a stat.
     Returns True if lower is better (e.g., turnovers), False if higher is better.
+    Pure function called from the inner comparison loops, so results are cached.
     """
     category_lower = category_name.lower()
     
@@ -460,15 +944,30 @@ def get_color_for_performance(better_than, total_teams):
         return Colors.YELLOW
 
 
-def compare_teams(selected_team: Team, all_teams: list, league: League, week: int):
-    """Compare selected team's stats against all other teams."""
+def compare_teams(selected_team: Team, team_lookup: dict, team_ids, league: League,
+                  week: int, weeks=None, current_week: int = None):
+    """
+    Compare selected team's stats against all other teams.
+
+    team_lookup is the {team_id: Team} dict and team_ids the roster-order
+    id tuple, both built once in main() and shared with the head-to-head
+    report. weeks optionally lists every week whose bundle should be
+    prefetched in one concurrent burst (e.g. range(1, week + 1) to warm a
+    whole season); the comparison itself is always for `week`. current_week
+    lets the stats cache treat already-completed weeks as permanent.
+    """
     print(f"\n{'='*80}")
     print(f"Comparing {selected_team.name} (Week {week})")
     print(f"{'='*80}\n")
-    
+
+    # Warm every requested week's bundle at the cost of ~one round trip
+    if weeks is None:
+        weeks = (week,)
+    prefetch_weeks(league, weeks)
+
     # Get stats for all teams from matchups
     print("Fetching stats for all teams from matchups...")
-    all_team_stats = get_all_team_stats_from_matchups(league, week)
+    all_team_stats = get_all_team_stats_from_matchups(league, week, current_week)
     
     if not all_team_stats:
         print("Could not retrieve stats for any teams.")
@@ -486,10 +985,14 @@ def compare_teams(selected_team: Team, all_teams: list, league: League, week: in
         return
     
     categories_info = get_category_info_from_stats(sample_stats)
-    
+
     if not categories_info:
         print("Could not determine league categories.")
         return
+
+    # Calibrate percentage scales once so every conversion below is a
+    # single multiply rather than a branch ladder
+    _calibrate_percentage_scales(sample_stats)
     
     # Get selected team's stats
     selected_team_id = selected_team.team_id
@@ -500,193 +1003,173 @@ def compare_teams(selected_team: Team, all_teams: list, league: League, week: in
         print("Note: Your team may not have a matchup this week, or stats are not yet available.")
         return
     
-    # Build team lookup dictionary
-    team_lookup = {team.team_id: team for team in all_teams}
-    
+    # Precompute every team's converted value per category so the loops
+    # below are O(1) dict lookups instead of repeated linear scans
+    team_values = precompute_team_values(all_team_stats, categories_info)
+
+    # Stack every team's values into a (categories x teams) matrix and do the
+    # best/worst/win-count reductions in one vectorized sweep instead of
+    # per-category Python sorts and generator sums. The same matrix feeds
+    # the head-to-head report below, so it's built exactly once.
+    team_ids = [tid for tid in team_ids if tid in team_values]
+    team_idx = {tid: i for i, tid in enumerate(team_ids)}
+    sel_idx = team_idx[selected_team_id]
+
+    report = build_report_matrix(team_values, categories_info, team_ids)
+    values = report.values
+
+    # Flip the sign on lower-is-better categories so "max" always means
+    # "best", then run all the per-category reductions in one kernel pass
+    direction = np.where(report.lower_mask, np.float32(-1.0), np.float32(1.0))
+    vs_counts, best_idx, worst_idx, valid_counts = _reduce(values, direction, sel_idx)
+
+    # Build the whole report in memory and emit it with a single write at
+    # the end, instead of one flushing print() per row
+    lines = []
+
+    # Local binding for the per-row color reset
+    reset = Colors.RESET
+
     # For each category, compare selected team against all others
-    print(f"\n{'Category':<40} {'Your Team':<15} {'vs Teams':<20} {'Best':<20} {'Worst':<20}")
-    print("-" * 115)
-    
-    for cat_info in categories_info:
+    lines.append("\n" + _ROW_FMT('Category', 'Your Team', 'vs Teams', 'Best', 'Worst'))
+    lines.append("-" * 115)
+
+    for cat_idx, cat_info in enumerate(categories_info):
         stat_id = cat_info.get('id')  # Use stat ID, not index
         category_name = cat_info['name']
-        
+
         if not stat_id:
             # Fallback to index only if ID is not available
             stat_id = str(cat_info.get('index'))
-        
+
         # Get selected team's value for this category
-        selected_value = extract_stat_value(selected_stats, stat_id, category_name)
-        
-        if selected_value is None:
-            print(f"{category_name:<40} {'N/A':<15} {'-':<20} {'-':<20} {'-':<20}")
-            continue
-        
-        # Get all teams' values (including selected team) for best/worst calculation
-        # Also get other teams' values (excluding selected) for "vs Teams" calculation
-        all_values = []
-        other_values = []
-        
-        for team_id, stats_list in all_team_stats.items():
-            if team_id not in team_lookup:
-                continue
-            
-            value = extract_stat_value(stats_list, stat_id, category_name)
-            if value is not None:
-                team_name = team_lookup[team_id].name
-                all_values.append((team_name, value))
-                
-                # Add to other_values only if not the selected team
-                if team_id != selected_team_id:
-                    other_values.append((team_name, value))
-        
-        if not all_values:
-            # No values available for any team
-            print(f"{category_name:<40} {'N/A':<15} {'-':<20} {'-':<20} {'-':<20}")
+        selected_value = values[cat_idx, sel_idx]
+
+        if np.isnan(selected_value) or valid_counts[cat_idx] == 0:
+            lines.append(_ROW_FMT(category_name, 'N/A', '-', '-', '-'))
             continue
-        
-        # Determine if higher is better (most stats) or lower is better (turnovers, etc.)
-        # Turnovers: lower is better
-        # Everything else (including percentages): higher is better
-        higher_is_better = not is_lower_better_stat(category_name, stat_id)
-        
-        # Sort all values (including selected team) to find best/worst
-        sorted_all_values = sorted(all_values, key=lambda x: x[1], reverse=higher_is_better)
-        best_team, best_value = sorted_all_values[0]
-        worst_team, worst_value = sorted_all_values[-1]
-        
+
+        selected_value = float(selected_value)
+
+        # Best/worst across all teams (including selected team)
+        best_col = int(best_idx[cat_idx])
+        worst_col = int(worst_idx[cat_idx])
+        best_team = team_lookup[team_ids[best_col]].name
+        worst_team = team_lookup[team_ids[worst_col]].name
+        best_value = float(values[cat_idx, best_col])
+        worst_value = float(values[cat_idx, worst_col])
+
         # Count how many OTHER teams you're better than (for "vs Teams" column)
-        if not other_values:
+        other_count = int(valid_counts[cat_idx]) - 1
+        if other_count <= 0:
             # No other teams to compare against
-            vs_teams = "0/0"
             vs_teams_colored = "-"
         else:
-            if higher_is_better:
-                better_than = sum(1 for _, val in other_values if selected_value > val)
-            else:
-                better_than = sum(1 for _, val in other_values if selected_value < val)
-            
-            vs_teams = f"{better_than}/{len(other_values)}"
+            better_than = int(vs_counts[cat_idx])
+            vs_teams = f"{better_than}/{other_count}"
             # Get color for performance
-            color = get_color_for_performance(better_than, len(other_values))
-            vs_teams_colored = f"{color}{vs_teams}{Colors.RESET}"
-        
+            color = get_color_for_performance(better_than, other_count)
+            vs_teams_colored = f"{color}{vs_teams}{reset}"
+
         # Format the value display
         # For percentages, values are already converted to decimals (0.850 = 85.0%)
         # Display as percentage with 1 decimal place
-        if isinstance(selected_value, float):
-            if "%" in category_name:
-                # Convert decimal to percentage: 0.850 -> 85.0%
-                selected_str = f"{selected_value * 100:.1f}%"
-            else:
-                selected_str = f"{selected_value:.2f}"
-        else:
-            selected_str = str(selected_value)
-        
-        if isinstance(best_value, float):
-            if "%" in category_name:
-                best_str = f"{best_value * 100:.1f}% ({best_team[:15]})"
-            else:
-                best_str = f"{best_value:.2f} ({best_team[:15]})"
-        else:
-            best_str = f"{best_value} ({best_team[:15]})"
-        
-        if isinstance(worst_value, float):
-            if "%" in category_name:
-                worst_str = f"{worst_value * 100:.1f}% ({worst_team[:15]})"
-            else:
-                worst_str = f"{worst_value:.2f} ({worst_team[:15]})"
+        is_pct = bool(report.pct_mask[cat_idx])
+
+        if is_pct:
+            # Convert decimal to percentage: 0.850 -> 85.0%
+            selected_str = _PCT_FMT(selected_value * 100)
+            best_str = _BEST_FMT(_PCT_FMT(best_value * 100), best_team[:15])
+            worst_str = _BEST_FMT(_PCT_FMT(worst_value * 100), worst_team[:15])
         else:
-            worst_str = f"{worst_value} ({worst_team[:15]})"
-        
-        print(f"{category_name:<40} {selected_str:<15} {vs_teams_colored:<20} {best_str:<20} {worst_str:<20}")
-    
-    print("\n" + "="*115)
-    print("Note: 'vs Teams' shows how many teams you're better than out of total teams")
-    print("      Percentages are shown with 1 decimal place, other stats with 2")
-    print(f"      {Colors.GREEN}Green{Colors.RESET} = beating 70%+ teams, {Colors.YELLOW}Yellow{Colors.RESET} = 30-70%, {Colors.RED}Red{Colors.RESET} = <30%")
-    print("="*115)
+            selected_str = _NUM_FMT(selected_value)
+            best_str = _BEST_FMT(_NUM_FMT(best_value), best_team[:15])
+            worst_str = _BEST_FMT(_NUM_FMT(worst_value), worst_team[:15])
+
+        lines.append(_ROW_FMT(category_name, selected_str, vs_teams_colored, best_str, worst_str))
+
+    lines.append("\n" + "="*115)
+    lines.append("Note: 'vs Teams' shows how many teams you're better than out of total teams")
+    lines.append("      Percentages are shown with 1 decimal place, other stats with 2")
+    lines.append(f"      {Colors.GREEN}Green{Colors.RESET} = beating 70%+ teams, {Colors.YELLOW}Yellow{Colors.RESET} = 30-70%, {Colors.RED}Red{Colors.RESET} = <30%")
+    lines.append("="*115)
+    sys.stdout.write("\n".join(lines) + "\n")
     
-    # Show head-to-head matchups
-    compare_head_to_head(selected_team, selected_stats, all_teams, all_team_stats, categories_info)
+    # Show head-to-head matchups, reusing the same report snapshot
+    compare_head_to_head(selected_team, team_lookup, report, sel_idx,
+                         categories_info)
 
 
-def compare_head_to_head(selected_team: Team, selected_stats: list, all_teams: list,
-                         all_team_stats: dict, categories_info: list):
+def compare_head_to_head(selected_team: Team, team_lookup: dict,
+                         report: LeagueReport, sel_idx: int,
+                         categories_info: list):
     """
     Compare selected team head-to-head against each other team.
     Shows the category win-loss record for each matchup.
+
+    Operates on the shared LeagueReport matrix from build_report_matrix,
+    so no stats list is re-traversed here - the whole W/L/T grid comes
+    from a couple of vectorized comparisons.
     """
-    print(f"\n{'='*115}")
-    print(f"Head-to-Head Matchups: {selected_team.name}")
-    print(f"{'='*115}\n")
-    
-    # Build team lookup dictionary
-    team_lookup = {team.team_id: team for team in all_teams}
-    selected_team_id = selected_team.team_id
-    
+    values = report.values
+    team_ids = report.team_ids
+
+    # Build the whole report in memory and emit it with a single write at
+    # the end, instead of one flushing print() per row
+    lines = []
+
+    lines.append(f"\n{'='*115}")
+    lines.append(f"Head-to-Head Matchups: {selected_team.name}")
+    lines.append(f"{'='*115}\n")
+
     # Header
-    print(f"{'Opponent':<30} {'Score':<12} {'Wins':<8} {'Losses':<8} {'Categories (W=Win, L=Loss, T=Tie)'}")
-    print("-" * 115)
-    
+    lines.append(f"{'Opponent':<30} {'Score':<12} {'Wins':<8} {'Losses':<8} {'Categories (W=Win, L=Loss, T=Tie)'}")
+    lines.append("-" * 115)
+
+    # Flip the sign on lower-is-better categories so ">" always means "win"
+    direction = np.where(report.lower_mask, np.float32(-1.0), np.float32(1.0))[:, None]
+    directed = values * direction
+    selected_col = directed[:, sel_idx:sel_idx + 1]
+
+    # Only cells where both the selected team and the opponent have a value
+    valid = ~np.isnan(directed) & ~np.isnan(selected_col)
+    # NaN comparisons are False, but mask explicitly so ties stay accurate
+    with np.errstate(invalid='ignore'):
+        win_matrix = (selected_col > directed) & valid
+        loss_matrix = (selected_col < directed) & valid
+    win_counts = win_matrix.sum(axis=0)
+    loss_counts = loss_matrix.sum(axis=0)
+
     matchup_results = []
-    
-    for team_id, stats_list in all_team_stats.items():
-        if team_id == selected_team_id:
+
+    for col, team_id in enumerate(team_ids):
+        if col == sel_idx:
             continue
-        
+
         if team_id not in team_lookup:
             continue
-        
+
         opponent_team = team_lookup[team_id]
-        opponent_stats = stats_list
-        
-        # Compare category by category
-        wins = 0
-        losses = 0
+
+        wins = int(win_counts[col])
+        losses = int(loss_counts[col])
+
+        # Per-category W/L/T letters for the display column
         category_results = []
-        
-        for cat_info in categories_info:
-            stat_id = cat_info.get('id')
-            category_name = cat_info['name']
-            
-            if not stat_id:
-                continue
-            
-            # Get values for both teams
-            selected_value = extract_stat_value(selected_stats, stat_id, category_name)
-            opponent_value = extract_stat_value(opponent_stats, stat_id, category_name)
-            
-            if selected_value is None or opponent_value is None:
+        for cat_idx, cat_info in enumerate(categories_info):
+            if not valid[cat_idx, col]:
                 continue
-            
-            # Determine if higher is better
-            higher_is_better = not is_lower_better_stat(category_name, stat_id)
-            
-            # Compare values
-            if higher_is_better:
-                if selected_value > opponent_value:
-                    wins += 1
-                    category_results.append((category_name, 'W'))
-                elif selected_value < opponent_value:
-                    losses += 1
-                    category_results.append((category_name, 'L'))
-                else:
-                    category_results.append((category_name, 'T'))
+            if win_matrix[cat_idx, col]:
+                result_code = 'W'
+            elif loss_matrix[cat_idx, col]:
+                result_code = 'L'
             else:
-                # Lower is better (turnovers)
-                if selected_value < opponent_value:
-                    wins += 1
-                    category_results.append((category_name, 'W'))
-                elif selected_value > opponent_value:
-                    losses += 1
-                    category_results.append((category_name, 'L'))
-                else:
-                    category_results.append((category_name, 'T'))
-        
+                result_code = 'T'
+            category_results.append((cat_info['name'], result_code))
+
         # Create score string
         score = f"{wins}-{losses}"
-        
+
         matchup_results.append({
             'team': opponent_team,
             'score': score,
@@ -696,8 +1179,12 @@ def compare_head_to_head(selected_team: Team, selected_stats: list, all_teams: l
         })
     
     # Sort by wins (descending) to show best matchups first
-    matchup_results.sort(key=lambda x: x['wins'], reverse=True)
+    # itemgetter avoids a Python-level lambda call per comparison
+    matchup_results.sort(key=operator.itemgetter('wins'), reverse=True)
     
+    # Local bindings for the per-cell color lookups below
+    green, yellow, red, reset = Colors.GREEN, Colors.YELLOW, Colors.RED, Colors.RESET
+
     # Display results
     for result in matchup_results:
         team_name = result['team'].name
@@ -710,20 +1197,20 @@ def compare_head_to_head(selected_team: Team, selected_stats: list, all_teams: l
         # Green for winning matchups (wins > losses)
         # Yellow for losing or tie matchups (wins <= losses)
         if wins > losses:
-            score_color = Colors.GREEN
+            score_color = green
         else:
-            score_color = Colors.YELLOW
-        score_colored = f"{score_color}{score}{Colors.RESET}"
+            score_color = yellow
+        score_colored = f"{score_color}{score}{reset}"
         
         # Format category results with colors
         category_display = []
         for cat_name, result_code in category_results:
             if result_code == 'W':
-                color = Colors.GREEN
+                color = green
             elif result_code == 'L':
-                color = Colors.RED
+                color = red
             else:  # T for tie
-                color = Colors.YELLOW
+                color = yellow
             # Abbreviate longer category names for compact display
             cat_display = cat_name
             if len(cat_name) > 8:
@@ -732,16 +1219,17 @@ def compare_head_to_head(selected_team: Team, selected_stats: list, all_teams: l
                 elif 'Made' in cat_name:
                     cat_display = cat_name.replace(' Made', 'M')
             
-            category_display.append(f"{color}{cat_display}:{result_code}{Colors.RESET}")
+            category_display.append(f"{color}{cat_display}:{result_code}{reset}")
         
         # Join categories with spacing
         categories_str = "  ".join(category_display)
         
-        print(f"{team_name:<30} {score_colored:<20} {wins:<8} {losses:<8} {categories_str}")
-    
-    print("\n" + "="*115)
-    print("Note: Score shows wins-losses for your team. Categories show W=Win (green), L=Loss (red), T=Tie (yellow)")
-    print("="*115)
+        lines.append(f"{team_name:<30} {score_colored:<20} {wins:<8} {losses:<8} {categories_str}")
+
+    lines.append("\n" + "="*115)
+    lines.append("Note: Score shows wins-losses for your team. Categories show W=Win (green), L=Loss (red), T=Tie (yellow)")
+    lines.append("="*115)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -752,51 +1240,78 @@ def main():
     
     # Authenticate
     ctx = authenticate()
-    
-    # Select sport
-    sport = select_sport()
-    
-    # Select league
-    league = select_league(ctx, sport)
-    
-    # Get current week
-    current_week = get_current_week(league)
-    print(f"\nCurrent week: {current_week}")
-    
-    # Sync league data to ensure game_code and other attributes are set
-    # This is critical for accessing matchup stats in category leagues
-    print("\nSyncing league data...")
-    if sync_league_data(league, current_week):
-        print("✓ League data synced successfully")
-    else:
-        print("⚠ Warning: League data sync had issues, but continuing...")
-    
-    # Get matchups for current week
-    print(f"\nFetching matchups for week {current_week}...")
+
+    # Pool for speculative fetches that overlap with the interactive
+    # prompts - by the time the user answers, the data is usually cached
+    pool = ThreadPoolExecutor(max_workers=4)
     try:
-        from yahoofantasy.resources.week import Week
-        week_obj = Week(ctx, league, current_week)
-        week_obj.sync()
-        matchups = week_obj.matchups
-        
-        print(f"Found {len(matchups)} matchup(s) for week {current_week}")
-        for matchup in matchups:
-            team1_name = matchup.team1.name if hasattr(matchup, 'team1') and matchup.team1 else "TBD"
-            team2_name = matchup.team2.name if hasattr(matchup, 'team2') and matchup.team2 else "TBD"
-            print(f"  {team1_name} vs {team2_name}")
-    except Exception as e:
-        print(f"Warning: Could not fetch matchups: {e}")
-        import traceback
-        traceback.print_exc()
+        # Warm the default sport's leagues while the user picks a sport
+        leagues_future = pool.submit(get_cached_leagues, ctx, 'nba', DEFAULT_SEASON)
+
+        # Select sport
+        sport = select_sport()
+
+        # Select league (only reuse the speculative fetch if the sport matches)
+        league = select_league(
+            ctx, sport,
+            pool=pool,
+            leagues_future=leagues_future if sport == 'nba' else None,
+        )
     
-    # Select team
-    selected_team = select_team(league)
+        # Get current week
+        current_week = get_current_week(league)
+        print(f"\nCurrent week: {current_week}")
     
-    # Get all teams for comparison
-    all_teams = league.teams()
+        # Sync league data to ensure game_code and other attributes are set
+        # This is critical for accessing matchup stats in category leagues
+        print("\nSyncing league data...")
+        if sync_league_data(league, current_week):
+            print("✓ League data synced successfully")
+        else:
+            print("⚠ Warning: League data sync had issues, but continuing...")
+
+        # Matchup.team1/team2 resolve names through the library's own teams
+        # persistence, and on a miss that path does an unlocked fetch+save of
+        # the shared pickle. Materialize it once under the lock before any
+        # matchup access so those property lookups never race the background
+        # warm threads that may still be running
+        try:
+            with _PERSIST_LOCK:
+                league.teams()
+        except Exception as e:
+            print(f"Warning: Could not preload league teams: {e}")
+
+        # Get matchups for current week (served from the batched bundle)
+        print(f"\nFetching matchups for week {current_week}...")
+        try:
+            matchups = get_week_matchups(league, current_week)
+
+            print(f"Found {len(matchups)} matchup(s) for week {current_week}")
+            for matchup in matchups:
+                team1_name = matchup.team1.name if hasattr(matchup, 'team1') and matchup.team1 else "TBD"
+                team2_name = matchup.team2.name if hasattr(matchup, 'team2') and matchup.team2 else "TBD"
+                print(f"  {team1_name} vs {team2_name}")
+        except Exception as e:
+            print(f"Warning: Could not fetch matchups: {e}")
+            import traceback
+            traceback.print_exc()
     
-    # Compare teams
-    compare_teams(selected_team, all_teams, league, current_week)
+        # Select team
+        selected_team = select_team(league)
+    
+        # Get all teams for comparison and build the shared lookup structures
+        all_teams = get_league_teams(league)
+        team_lookup = {t.team_id: t for t in all_teams}
+        team_ids = tuple(t.team_id for t in all_teams)
+
+        # Compare teams
+        compare_teams(selected_team, team_lookup, team_ids, league, current_week,
+                      current_week=current_week)
+    finally:
+        # Don't hold up process exit (including sys.exit from the prompts)
+        # waiting on queued speculative warms - each one wraps a network
+        # round trip in _PERSIST_LOCK
+        pool.shutdown(wait=False, cancel_futures=True)
 
 
 if __name__ == "__main__":